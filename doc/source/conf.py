@@ -6,8 +6,13 @@
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
+import pathlib
+import sys
+
 import pathseq
 
+sys.path.insert(0, str(pathlib.Path(__file__).parent / "_ext"))
+
 project = "pathseq"
 copyright = "2024, Ashley Whetter"
 author = "Ashley Whetter"
@@ -20,7 +25,7 @@ extensions = [
     "sphinx_design",
     "sphinx.ext.intersphinx",
     "sphinx.ext.napoleon",
-    "sphinx.ext.todo",
+    "pathseq_sectnum",
 ]
 
 templates_path = ["_templates"]
@@ -55,77 +60,3 @@ autodoc_default_options = {
 autodoc_type_aliases = {
     "ParsedLooseSequence": "ParsedLooseSequence",
 }
-
-
-# -- Patch section numbering -------------------------------------------------
-
-from docutils import nodes
-from docutils.parsers.rst.directives.parts import Sectnum as SectnumDirective
-from docutils.transforms.parts import SectNum as SectnumTransform
-
-
-class Sectnum(SectnumDirective):
-    """
-    Override the Sectnum directive to call my own Sectnum transform
-    """
-
-    def run(self):
-        pending = nodes.pending(SectNumTrans)
-        pending.details.update(self.options)
-        self.state_machine.document.note_pending(pending)
-        return [pending]
-
-
-class SectNumTrans(SectnumTransform):
-    """
-    Override `Sectnum` from docutils
-
-    I do not want the big title of the page to be numbered:
-
-        Document Name
-
-        1. Section
-           1.1. Subsection
-
-    And not
-
-        1. Document Name
-
-        1.1 Section
-           1.1.1. Subsection
-
-    """
-
-    start_depth = 1
-
-    def update_section_numbers(self, node, prefix=(), depth=0, level=0):
-        self.suffix = "."
-        depth += 1
-        if prefix:
-            sectnum = 1
-        else:
-            sectnum = self.startvalue
-        level += 1
-        index_rule = 1
-        index_directive = 1
-        for child in node:
-            if isinstance(child, nodes.section):
-                title = child[0]
-
-                if level > self.start_depth:
-                    numbers = prefix + (str(sectnum),)
-                    text = self.prefix + ".".join(numbers) + self.suffix + "\u00a0" * 2
-                else:
-                    numbers = prefix
-                    text = ""
-
-                generated = nodes.generated("", text, classes=["sectnum"])
-                title.insert(0, generated)
-                title["auto"] = 1
-                if depth < self.maxdepth:
-                    self.update_section_numbers(child, numbers, depth, level)
-                sectnum += 1
-
-
-def setup(app):
-    app.add_directive("sectnum", Sectnum)
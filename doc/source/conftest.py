@@ -6,7 +6,10 @@ import pathseq
 
 
 @pytest.fixture(autouse=True)
-def add_pathseq(doctest_namespace):
+def add_pathseq(request, doctest_namespace):
+    if not isinstance(request.node, pytest.DoctestItem):
+        return
+
     doctest_namespace["pathseq"] = pathseq
     for attr in pathseq.__all__:
         doctest_namespace[attr] = getattr(pathseq, attr)
@@ -1,22 +1,28 @@
 """A pathlib-first library for working with file sequences."""
 
-from ._ast import (
-    Formatter,
-    PaddedRange,
-    ParsedLooseSequence,
-    ParsedSequence,
-    Ranges,
-    RangesEndName,
-    RangesInName,
-    RangesStartName,
-)
-from ._base import BasePathSequence, BasePurePathSequence, PathT_co, PurePathT_co
-from ._error import IncompleteDimensionError, NotASequenceError, ParseError
-from ._file_num_seq import FileNumSequence, FileNumT
-from ._loose_path_sequence import LoosePathSequence
-from ._loose_pure_path_sequence import LoosePurePathSequence
-from ._path_sequence import PathSequence
-from ._pure_path_sequence import PurePathSequence
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._ast import (
+        Formatter,
+        PaddedRange,
+        ParsedLooseSequence,
+        ParsedSequence,
+        Ranges,
+        RangesEndName,
+        RangesInName,
+        RangesStartName,
+    )
+    from ._base import BasePathSequence, BasePurePathSequence, PathT_co, PurePathT_co
+    from ._error import IncompleteDimensionError, NotASequenceError, ParseError
+    from ._file_num_seq import FileNumSequence, FileNumT
+    from ._loose_path_sequence import LoosePathSequence
+    from ._loose_pure_path_sequence import LoosePurePathSequence
+    from ._path_sequence import PathSequence
+    from ._pure_path_sequence import PurePathSequence
 
 __version__ = "0.1.0"
 
@@ -43,3 +49,48 @@ __all__ = (
     "RangesInName",
     "RangesStartName",
 )
+
+# Importing the submodules compiles the parsers,
+# so defer doing so until a public name is first accessed.
+_SUBMODULE_ATTRS = {
+    "._ast": (
+        "Formatter",
+        "PaddedRange",
+        "ParsedLooseSequence",
+        "ParsedSequence",
+        "Ranges",
+        "RangesEndName",
+        "RangesInName",
+        "RangesStartName",
+    ),
+    "._base": (
+        "BasePathSequence",
+        "BasePurePathSequence",
+        "PathT_co",
+        "PurePathT_co",
+    ),
+    "._error": ("IncompleteDimensionError", "NotASequenceError", "ParseError"),
+    "._file_num_seq": ("FileNumSequence", "FileNumT"),
+    "._loose_path_sequence": ("LoosePathSequence",),
+    "._loose_pure_path_sequence": ("LoosePurePathSequence",),
+    "._path_sequence": ("PathSequence",),
+    "._pure_path_sequence": ("PurePathSequence",),
+}
+_ATTR_SUBMODULES = {
+    attr: submodule for submodule, attrs in _SUBMODULE_ATTRS.items() for attr in attrs
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        submodule = _ATTR_SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -4,6 +4,7 @@ from collections.abc import Iterable
 import dataclasses
 from decimal import Decimal
 import typing
+from typing import Any
 
 if typing.TYPE_CHECKING:
     from ._loose_type import ParsedLooseSequence
@@ -11,6 +12,19 @@ if typing.TYPE_CHECKING:
     from ._type import ParsedSequence
 
 
+_FIELD_NAMES: dict[type[Any], tuple[str, ...]] = {}
+
+
+def _field_names(datacls: type[Any]) -> tuple[str, ...]:
+    """Get the names of the fields of a dataclass to format, in definition order."""
+    try:
+        return _FIELD_NAMES[datacls]
+    except KeyError:
+        names = tuple(field.name for field in dataclasses.fields(datacls))
+        _FIELD_NAMES[datacls] = names
+        return names
+
+
 def _splice_strings_onto_ranges(
     strings: Iterable[str], inter_ranges: Iterable[str]
 ) -> str:
@@ -20,31 +34,20 @@ def _splice_strings_onto_ranges(
         TypeError: If the given number of strings does not match
             the number of inter-range strings minus one.
     """
-    result = ""
-
-    strs = iter(strings)
-    for inter_range in inter_ranges:
-        try:
-            result += next(strs)
-        except StopIteration:
-            break
-
-        result += inter_range
-    else:
-        try:
-            result += next(strs)
-        except StopIteration:
-            pass
-        else:
-            try:
-                next(strs)
-            except StopIteration:
-                return result
-
-    raise TypeError(
-        "The number of inter-range strings given does not match"
-        " the number of range strings given minus one."
-    )
+    if not isinstance(strings, list):
+        strings = list(strings)
+    if not isinstance(inter_ranges, list):
+        inter_ranges = list(inter_ranges)
+    if len(inter_ranges) != len(strings) - 1:
+        raise TypeError(
+            "The number of inter-range strings given does not match"
+            " the number of range strings given minus one."
+        )
+
+    spliced = [""] * (len(strings) + len(inter_ranges))
+    spliced[::2] = strings
+    spliced[1::2] = inter_ranges
+    return "".join(spliced)
 
 
 class Formatter:
@@ -81,8 +84,8 @@ class Formatter:
 
     def ranges(self, ranges: Ranges) -> str:
         return self.splice_inter_ranges(
-            (self.range(range_) for range_ in ranges.ranges),
-            (self.inter_range(inter_range) for inter_range in ranges.inter_ranges),
+            [self.range(range_) for range_ in ranges.ranges],
+            [self.inter_range(inter_range) for inter_range in ranges.inter_ranges],
         )
 
     def postfix(self, postfix: str) -> str:
@@ -104,8 +107,10 @@ class Formatter:
             The formatter path sequence.
         """
         return "".join(
-            getattr(self, field.name)(getattr(seq, field.name))
-            for field in dataclasses.fields(seq)
+            [
+                getattr(self, name)(getattr(seq, name))
+                for name in _field_names(type(seq))
+            ]
         )
 
     def splice_inter_ranges(
@@ -1,19 +1,33 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Literal, TypeAlias, Union
 
 from typing_extensions import Self  # PY311
 
+from .._cache import cache_in, reduce_uncached
 from ._formatter import Formatter
 from ._ranges import Ranges
-from ._util import non_recursive_asdict
+from ._util import replace_suffix
+
+_FORMATTER = Formatter()
 
 
 @dataclass(frozen=True)
 class RangesStartName:
     """A parsed loose path sequence where the range starts a path's name."""
 
+    __slots__ = (
+        "__weakref__",
+        "_hash",
+        "_str",
+        "postfix",
+        "prefix",
+        "ranges",
+        "stem",
+        "suffixes",
+    )
+
     prefix: Literal[""]
     """An optional single character separator between the ranges and the previous component.
 
@@ -38,19 +52,31 @@ class RangesStartName:
     Each suffix includes the leading "``.``".
     """
 
+    @cache_in("_str")
     def __str__(self) -> str:
-        return Formatter().format(self)
+        return _FORMATTER.format(self)
+
+    @cache_in("_hash")
+    def __hash__(self) -> int:
+        return hash((self.prefix, self.ranges, self.postfix, self.stem, self.suffixes))
+
+    def __reduce__(self) -> tuple[type[Self], tuple[object, ...]]:
+        return reduce_uncached(
+            self, self.prefix, self.ranges, self.postfix, self.stem, self.suffixes
+        )
 
     def with_stem(self, stem: str) -> Self:
         """Return a new parsed sequence with the :attr:`~.RangesStartName.stem` changed.
 
         If the stem is removed, the postfix will be as well.
         """
-        kwargs = non_recursive_asdict(self)
-        kwargs["stem"] = stem
         if not stem:
-            kwargs["postfix"] = ""
-        return self.__class__(**kwargs)
+            return replace(self, stem=stem, postfix="")
+
+        if stem == self.stem:
+            return self
+
+        return replace(self, stem=stem)
 
     def with_suffix(self, suffix: str) -> Self:
         """Return a new parsed sequence with the suffix changed.
@@ -62,27 +88,28 @@ class RangesStartName:
         Raises:
             ValueError: If an invalid suffix is given.
         """
-        if suffix:
-            if not suffix.startswith(".") or suffix == ".":
-                raise ValueError(f"Invalid suffix '{suffix}'")
+        suffixes = replace_suffix(self.suffixes, suffix, allow_bare_dot=False)
+        if suffixes is self.suffixes:
+            return self
 
-            kwargs = non_recursive_asdict(self)
-            add_suffixes = tuple(f".{s}" for s in suffix[1:].split("."))
-            kwargs["suffixes"] = self.suffixes[:-1] + add_suffixes
-            return self.__class__(**kwargs)
-
-        if self.suffixes:
-            kwargs = non_recursive_asdict(self)
-            kwargs["suffixes"] = self.suffixes[:-1]
-            return self.__class__(**kwargs)
-
-        return self
+        return replace(self, suffixes=suffixes)
 
 
 @dataclass(frozen=True)
 class RangesInName:
     """A parsed loose range sequence where the range follows a path's stem."""
 
+    __slots__ = (
+        "__weakref__",
+        "_hash",
+        "_str",
+        "postfix",
+        "prefix",
+        "ranges",
+        "stem",
+        "suffixes",
+    )
+
     stem: str
     """The name of the sequence, without the prefix, ranges, postfix, and suffixes."""
     prefix: str
@@ -107,19 +134,31 @@ class RangesInName:
     Each suffix includes the leading "``.``".
     """
 
+    @cache_in("_str")
     def __str__(self) -> str:
-        return Formatter().format(self)
+        return _FORMATTER.format(self)
+
+    @cache_in("_hash")
+    def __hash__(self) -> int:
+        return hash((self.stem, self.prefix, self.ranges, self.postfix, self.suffixes))
+
+    def __reduce__(self) -> tuple[type[Self], tuple[object, ...]]:
+        return reduce_uncached(
+            self, self.stem, self.prefix, self.ranges, self.postfix, self.suffixes
+        )
 
     def with_stem(self, stem: str) -> Self:
         """Return a new parsed sequence with the :attr:`~.RangesInName.stem` changed.
 
         If the stem is removed, the prefix will be as well.
         """
-        kwargs = non_recursive_asdict(self)
-        kwargs["stem"] = stem
-        if not stem and self.stem:
-            kwargs["prefix"] = ""
-        return self.__class__(**kwargs)
+        if stem == self.stem:
+            return self
+
+        if not stem:
+            return replace(self, stem=stem, prefix="")
+
+        return replace(self, stem=stem)
 
     def with_suffix(self, suffix: str) -> Self:
         """Return a new parsed sequence with the suffix changed.
@@ -131,29 +170,31 @@ class RangesInName:
         Raises:
             ValueError: If an invalid suffix is given.
         """
-        if suffix:
-            if not suffix.startswith("."):
-                raise ValueError(f"Invalid suffix '{suffix}'")
+        suffixes = replace_suffix(self.suffixes, suffix)
+        if suffixes is self.suffixes:
+            return self
 
-            kwargs = non_recursive_asdict(self)
-            add_suffixes = tuple(f".{s}" for s in suffix[1:].split("."))
-            kwargs["suffixes"] = self.suffixes[:-1] + add_suffixes
-            return self.__class__(**kwargs)
+        if not suffixes:
+            return replace(self, suffixes=suffixes, postfix="")
 
-        if self.suffixes:
-            kwargs = non_recursive_asdict(self)
-            kwargs["suffixes"] = self.suffixes[:-1]
-            if not kwargs["suffixes"]:
-                kwargs["postfix"] = ""
-            return self.__class__(**kwargs)
-
-        return self
+        return replace(self, suffixes=suffixes)
 
 
 @dataclass(frozen=True)
 class RangesEndName:
     """A parsed loose range sequence where the range ends a path's name."""
 
+    __slots__ = (
+        "__weakref__",
+        "_hash",
+        "_str",
+        "postfix",
+        "prefix",
+        "ranges",
+        "stem",
+        "suffixes",
+    )
+
     stem: str
     """The name of the sequence, without the prefix, ranges, postfix, and suffixes."""
     suffixes: tuple[str, ...]
@@ -178,14 +219,25 @@ class RangesEndName:
     and :class:`~.RangesEndName` all have the same attributes.
     """
 
+    @cache_in("_str")
     def __str__(self) -> str:
-        return Formatter().format(self)
+        return _FORMATTER.format(self)
+
+    @cache_in("_hash")
+    def __hash__(self) -> int:
+        return hash((self.stem, self.suffixes, self.prefix, self.ranges, self.postfix))
+
+    def __reduce__(self) -> tuple[type[Self], tuple[object, ...]]:
+        return reduce_uncached(
+            self, self.stem, self.suffixes, self.prefix, self.ranges, self.postfix
+        )
 
     def with_stem(self, stem: str) -> Self:
         """Return a new parsed sequence with the :attr:`~.RangesEndName.stem` changed."""
-        kwargs = non_recursive_asdict(self)
-        kwargs["stem"] = stem
-        return self.__class__(**kwargs)
+        if stem == self.stem:
+            return self
+
+        return replace(self, stem=stem)
 
     def with_suffix(self, suffix: str) -> Self:
         """Return a new parsed sequence with the suffix changed.
@@ -197,21 +249,11 @@ class RangesEndName:
         Raises:
             ValueError: If an invalid suffix is given.
         """
-        if suffix:
-            if not suffix.startswith("."):
-                raise ValueError(f"Invalid suffix '{suffix}'")
-
-            kwargs = non_recursive_asdict(self)
-            add_suffixes = tuple(f".{s}" for s in suffix[1:].split("."))
-            kwargs["suffixes"] = self.suffixes[:-1] + add_suffixes
-            return self.__class__(**kwargs)
-
-        if self.suffixes:
-            kwargs = non_recursive_asdict(self)
-            kwargs["suffixes"] = self.suffixes[:-1]
-            return self.__class__(**kwargs)
+        suffixes = replace_suffix(self.suffixes, suffix)
+        if suffixes is self.suffixes:
+            return self
 
-        return self
+        return replace(self, suffixes=suffixes)
 
 
 ParsedLooseSequence: TypeAlias = Union[RangesStartName, RangesInName, RangesEndName]
@@ -1,34 +1,52 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 import decimal
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Generic, TypeGuard
 
+from typing_extensions import Self  # PY311
+
+from .._cache import cache_in, reduce_uncached
+from .._file_num_seq import FileNumSequence, FileNumT
 from ._formatter import Formatter
 from ._util import pad
-from .._file_num_seq import FileNumSequence, FileNumT
+
+_FORMATTER = Formatter()
+
+
+def _format_uvtile(number: int | decimal.Decimal) -> str:
+    # udim = 1000+(v*10)+(u+1)
+    u = (number - 1) % 10
+    v = (number - 1000 - u - 1) // 10
+    return f"u{u + 1}_v{v + 1}"
 
 
 @dataclass(frozen=True)
 class PaddedRange(Generic[FileNumT]):
+    __slots__ = ("__weakref__", "_formatter", "_str", "file_nums", "pad_format")
+
     file_nums: FileNumSequence[FileNumT]
     """The file numbers of each file in the sequence."""
     pad_format: str
     """The definition of how a file number is formatted in each file's name in the sequence."""
 
+    @cache_in("_str")
     def __str__(self) -> str:
-        return str(self.file_nums) + self.pad_format
+        return f"{self.file_nums}{self.pad_format}"
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self})"
 
-    def format(self, number: int | decimal.Decimal) -> str:
-        """Format the given number using the range's padding rules."""
+    def __reduce__(self) -> tuple[type[Self], tuple[object, ...]]:
+        return reduce_uncached(self, self.file_nums, self.pad_format)
+
+    @cache_in("_formatter")
+    def _number_formatter(self) -> Callable[[int | decimal.Decimal], str]:
+        # Work out how to format numbers once, rather than on every call to format().
         if self.pad_format == "<UVTILE>":
-            # udim = 1000+(v*10)+(u+1)
-            u = (number - 1) % 10
-            v = (number - 1000 - u - 1) // 10
-            return f"u{u + 1}_v{v + 1}"
+            return _format_uvtile
 
         pad_format = self.pad_format
         if self.pad_format == "<UDIM>":
@@ -36,9 +54,13 @@ class PaddedRange(Generic[FileNumT]):
 
         if "." in pad_format:
             head, tail = pad_format.split(".", 1)
-            return pad(number, len(head), len(tail))
+            return functools.partial(pad, width=len(head), decimal_places=len(tail))
+
+        return functools.partial(pad, width=len(pad_format))
 
-        return pad(number, len(pad_format))
+    def format(self, number: int | decimal.Decimal) -> str:
+        """Format the given number using the range's padding rules."""
+        return self._number_formatter()(number)
 
     @staticmethod
     def has_subsamples(
@@ -50,6 +72,8 @@ class PaddedRange(Generic[FileNumT]):
 
 @dataclass(frozen=True)
 class Ranges:
+    __slots__ = ("__weakref__", "_str", "inter_ranges", "ranges")
+
     ranges: tuple[PaddedRange[int] | PaddedRange[decimal.Decimal], ...]
     """Each :ref:`range specifier <format-simple-ranges>` in the sequence."""
     inter_ranges: tuple[str, ...]
@@ -65,8 +89,12 @@ class Ranges:
                 " the number of range strings minus one."
             )
 
+    @cache_in("_str")
     def __str__(self) -> str:
-        return Formatter().ranges(self)
+        return _FORMATTER.ranges(self)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self})"
+
+    def __reduce__(self) -> tuple[type[Self], tuple[object, ...]]:
+        return reduce_uncached(self, self.ranges, self.inter_ranges)
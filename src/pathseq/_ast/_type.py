@@ -1,18 +1,31 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from typing_extensions import Self  # PY311
 
+from .._cache import cache_in, reduce_uncached
 from ._formatter import Formatter
 from ._ranges import Ranges
-from ._util import non_recursive_asdict
+from ._util import replace_suffix
+
+_FORMATTER = Formatter()
 
 
 @dataclass(frozen=True)
 class ParsedSequence:
     """A parsed path sequence."""
 
+    __slots__ = (
+        "__weakref__",
+        "_hash",
+        "_str",
+        "prefix",
+        "ranges",
+        "stem",
+        "suffixes",
+    )
+
     stem: str
     """The name of the sequence, without the prefix, ranges, and suffixes."""
     prefix: str
@@ -25,19 +38,29 @@ class ParsedSequence:
     Each suffix includes the leading "``.``".
     """
 
+    @cache_in("_str")
     def __str__(self) -> str:
-        return Formatter().format(self)
+        return _FORMATTER.format(self)
+
+    @cache_in("_hash")
+    def __hash__(self) -> int:
+        return hash((self.stem, self.prefix, self.ranges, self.suffixes))
+
+    def __reduce__(self) -> tuple[type[Self], tuple[object, ...]]:
+        return reduce_uncached(self, self.stem, self.prefix, self.ranges, self.suffixes)
 
     def with_stem(self, stem: str) -> Self:
         """Return a new parsed sequence with the :attr:`~.ParsedSequence.stem` changed.
 
         If the stem is removed, the prefix will be as well.
         """
-        kwargs = non_recursive_asdict(self)
-        kwargs["stem"] = stem
-        if not stem and self.stem:
-            kwargs["prefix"] = ""
-        return self.__class__(**kwargs)
+        if stem == self.stem:
+            return self
+
+        if not stem:
+            return replace(self, stem=stem, prefix="")
+
+        return replace(self, stem=stem)
 
     def with_suffix(self, suffix: str) -> Self:
         """Return a new parsed sequence with the suffix changed.
@@ -49,14 +72,8 @@ class ParsedSequence:
         Raises:
             ValueError: If an invalid suffix is given.
         """
-        kwargs = non_recursive_asdict(self)
-        if suffix:
-            if not suffix.startswith("."):
-                raise ValueError(f"Invalid suffix '{suffix}'")
-
-            add_suffixes = tuple(f".{s}" for s in suffix.split(".")[1:])
-            kwargs["suffixes"] = self.suffixes[:-1] + add_suffixes
-        else:
-            kwargs["suffixes"] = self.suffixes[:-1]
+        suffixes = replace_suffix(self.suffixes, suffix)
+        if suffixes is self.suffixes:
+            return self
 
-        return self.__class__(**kwargs)
+        return replace(self, suffixes=suffixes)
@@ -1,16 +1,51 @@
 from __future__ import annotations
 
-import dataclasses
 import decimal
-from typing import Any
+import functools
 
 
-def non_recursive_asdict(datacls: Any) -> dict[str, Any]:
-    """Like :func:`dataclasses.asdict` but does not recurse into attributes."""
-    return {
-        field.name: getattr(datacls, field.name)
-        for field in dataclasses.fields(datacls)
-    }
+def split_suffix(suffix: str) -> tuple[str, ...]:
+    """Split a suffix into the individual suffixes that it contains.
+
+    Each returned suffix includes the leading "``.``",
+    and so must the given suffix.
+    """
+    # Most suffixes are a single file extension, so there's nothing to split.
+    if suffix.find(".", 1) == -1:
+        return (suffix,)
+
+    return tuple(["." + part for part in suffix[1:].split(".")])
+
+
+def replace_suffix(
+    suffixes: tuple[str, ...], suffix: str, allow_bare_dot: bool = True
+) -> tuple[str, ...]:
+    """Replace the last of the given suffixes.
+
+    Args:
+        suffixes: The suffixes to replace the last suffix of.
+        suffix: The new suffix to replace the existing one with.
+            This must start with a "." or be the empty string,
+            in which case the last suffix is removed.
+        allow_bare_dot: Whether a suffix of only "." is valid.
+
+    Returns:
+        The new suffixes, or the given suffixes themselves
+        if the replacement would not change them.
+
+    Raises:
+        ValueError: If an invalid suffix is given.
+    """
+    if not suffix:
+        return suffixes[:-1] if suffixes else suffixes
+
+    if suffix[0] != "." or (not allow_bare_dot and len(suffix) == 1):
+        raise ValueError(f"Invalid suffix '{suffix}'")
+
+    if suffixes and suffixes[-1] == suffix:
+        return suffixes
+
+    return suffixes[:-1] + split_suffix(suffix)
 
 
 # The MIT License (MIT)
@@ -37,6 +72,11 @@ def non_recursive_asdict(datacls: Any) -> dict[str, Any]:
 # THE SOFTWARE.
 
 
+@functools.lru_cache(maxsize=32)
+def _quantize_exponent(decimal_places: int) -> decimal.Decimal:
+    return decimal.Decimal(1).scaleb(-decimal_places)
+
+
 def _quantize(
     number: decimal.Decimal,
     decimal_places: int,
@@ -53,8 +93,7 @@ def _quantize(
     Returns:
         decimal.Decimal:
     """
-    quantize_exponent = decimal.Decimal(1).scaleb(-decimal_places)
-    nq = number.quantize(quantize_exponent, rounding=rounding)
+    nq = number.quantize(_quantize_exponent(decimal_places), rounding=rounding)
     if nq.is_zero():
         return nq.copy_abs()
     return nq
@@ -71,6 +110,9 @@ def pad(
         decimal_places: number of decimal places to use in frame range
     """
 
+    if type(number) is int and not decimal_places:
+        return f"{number:0{width}d}"
+
     # Make the common case fast. Truncate to integer value as USD does.
     # https://graphics.pixar.com/usd/docs/api/_usd__page__value_clips.html
     # See _DeriveClipTimeString for formatting of templateAssetPath
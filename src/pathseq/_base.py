@@ -15,10 +15,11 @@ from typing_extensions import (
 )
 
 from ._ast import ParsedLooseSequence, ParsedSequence
+from ._cache import cache_in, reduce_uncached
 from ._error import ParseError
 from ._file_num_seq import FileNumSequence
 from ._from_disk import find_on_disk
-from ._formatters import FileNumberFormatter, RegexFormatter
+from ._formatters import compile_regex, format_file_names, format_name_affixes
 
 Segment: TypeAlias = Union[str, os.PathLike[str]]
 PurePathT_co = TypeVar(
@@ -36,9 +37,27 @@ class BasePurePathSequence(Sequence[PurePathT_co], metaclass=abc.ABCMeta):
         ParseError: When the given path is not a valid path sequence.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_file_num_seqs",
+        "_has_subsamples",
+        "_hash",
+        "_len",
+        "_membership",
+        "_parsed",
+        "_path",
+    )
+
     _pathlib_type: ClassVar[type[pathlib.PurePath]] = pathlib.PurePath
     _path: PurePathT_co
     _parsed: ParsedSequence | ParsedLooseSequence
+    _membership: (
+        tuple[re.Pattern[str], tuple[str, str], tuple[type[int | Decimal], ...]] | None
+    )
+    _len: int | None
+    _hash: int | None
+    _has_subsamples: bool | None
+    _file_num_seqs: tuple[FileNumSequence[int] | FileNumSequence[Decimal], ...] | None
 
     @overload
     def __init__(self: BasePurePathSequence[pathlib.PurePath], path: str) -> None: ...
@@ -54,6 +73,14 @@ class BasePurePathSequence(Sequence[PurePathT_co], metaclass=abc.ABCMeta):
         else:
             self._path = path
         self._parsed = self._parse(self._path.name)
+        self._membership = None
+        self._len = None
+        self._hash = None
+        self._has_subsamples = None
+        self._file_num_seqs = None
+
+    def __reduce__(self) -> tuple[type[Self], tuple[object, ...]]:
+        return reduce_uncached(self, self._path)
 
     @abc.abstractmethod
     def _parse(self, name: str) -> ParsedSequence | ParsedLooseSequence:
@@ -73,9 +100,23 @@ class BasePurePathSequence(Sequence[PurePathT_co], metaclass=abc.ABCMeta):
             >>> seq_a == seq_b
             True
         """
+        if self is other:
+            return True
+
         if not isinstance(other, self.__class__):
             return NotImplemented
 
+        # Hashes are only calculated on demand,
+        # but sequences in sets and dicts will have already calculated theirs.
+        # The type is part of the hash, so only compare hashes of the same type.
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and type(self) is type(other)
+            and self._hash != other._hash
+        ):
+            return False
+
         return self._path.parent == other._path.parent and self._parsed == other._parsed
 
     def __repr__(self) -> str:
@@ -84,6 +125,7 @@ class BasePurePathSequence(Sequence[PurePathT_co], metaclass=abc.ABCMeta):
     def __str__(self) -> str:
         return str(self._path)
 
+    @cache_in("_hash")
     def __hash__(self) -> int:
         """Path sequences are immutable, so can be hashed and used as dictionary keys."""
         return hash((type(self), self._path.parent, self._parsed))
@@ -133,6 +175,7 @@ class BasePurePathSequence(Sequence[PurePathT_co], metaclass=abc.ABCMeta):
         return self._parsed.stem
 
     @property
+    @cache_in("_file_num_seqs")
     def file_num_seqs(
         self,
     ) -> Sequence[FileNumSequence[int] | FileNumSequence[Decimal]]:
@@ -144,9 +187,11 @@ class BasePurePathSequence(Sequence[PurePathT_co], metaclass=abc.ABCMeta):
             (FileNumSequence(1011-1013), FileNumSequence(1-3))
         """
         ranges = tuple(
-            x.file_nums
-            for x in self._parsed.ranges.ranges
-            if not isinstance(x.file_nums, str)
+            [
+                x.file_nums
+                for x in self._parsed.ranges.ranges
+                if not isinstance(x.file_nums, str)
+            ]
         )
         if len(ranges) != len(self._parsed.ranges.ranges):
             raise TypeError(
@@ -318,7 +363,13 @@ class BasePurePathSequence(Sequence[PurePathT_co], metaclass=abc.ABCMeta):
             >>> p.path_with_file_nums(5)
             PurePosixPath('images.5.exr')
         """
-        name = FileNumberFormatter(*numbers).format(self._parsed)
+        num_ranges = len(self._parsed.ranges.ranges)
+        if len(numbers) < num_ranges:
+            raise TypeError(
+                "Insufficient number of file numbers given to format sequence"
+            )
+
+        name = next(format_file_names(self._parsed, [numbers[:num_ranges]]))
         return self._path.with_name(name)
 
     def with_suffix(self, suffix: str) -> Self:
@@ -374,62 +425,97 @@ class BasePurePathSequence(Sequence[PurePathT_co], metaclass=abc.ABCMeta):
         if not self:
             raise IndexError("Path sequence is empty so index is out of range")
 
-        file_num_seqs = [x.file_nums for x in self._parsed.ranges.ranges]
+        length = len(self)
         start = index
         if start < 0:
-            start += len(self)
+            start += length
             if start < 0:
                 raise IndexError("index out of range")
-        elif start > len(self):
+        elif start >= length:
             raise IndexError("index out of range")
 
-        indexes = [0 for _ in file_num_seqs]
-        for i, file_num_seq in enumerate(reversed(file_num_seqs), start=1):
-            next_idx = start % len(file_num_seq)
-            indexes[-i] = next_idx
-            start -= next_idx
+        # The last range changes the fastest when iterating,
+        # so the index is decomposed into a mixed radix number
+        # with a digit for each range.
+        ranges = self._parsed.ranges.ranges
+        file_nums: list[int | Decimal] = [0] * len(ranges)
+        for i in range(len(ranges) - 1, -1, -1):
+            file_num_seq = ranges[i].file_nums
+            start, digit = divmod(start, len(file_num_seq))
+            file_nums[i] = file_num_seq[digit]
 
         assert start == 0
-        file_nums = [
-            x.file_nums[i]
-            for x, i in zip(self._parsed.ranges.ranges, reversed(indexes))
-        ]
         return self.path_with_file_nums(*file_nums)
 
     def __contains__(self, item: object) -> bool:
-        """Return whether the given object exists in this path sequence."""
+        """Return whether the given object exists in this path sequence.
+
+        A path is only in the sequence if it has the same parent as the sequence.
+
+        .. code-block:: pycon
+
+            >>> s = PurePathSequence(PurePosixPath('/path/to/image.1-3####.exr'))
+            >>> PurePosixPath('/path/to/image.0002.exr') in s
+            True
+            >>> PurePosixPath('/other/image.0002.exr') in s
+            False
+        """
         if not isinstance(item, self._pathlib_type):
             return False
 
-        pattern = re.compile(RegexFormatter().format(self._parsed))
+        pattern, (head, tail), file_num_types = self._membership_test()
 
-        match = pattern.fullmatch(str(item.name))
+        # Most paths that aren't in the sequence can be rejected
+        # without running the pattern.
+        name = item.name
+        if not (name.startswith(head) and name.endswith(tail)):
+            return False
+
+        if item.parent != self._path.parent:
+            return False
+
+        match = pattern.fullmatch(name)
         if not match:
             return False
 
-        for i, range_ in enumerate(self._parsed.ranges.ranges):
-            group_name = f"range{i}"
-            group = match.group(group_name)
+        ranges = self._parsed.ranges.ranges
+        for i, file_num_type in enumerate(file_num_types):
+            group = match.group(f"range{i}")
             assert isinstance(group, str), "Got an unexpected type from regex group"
 
-            file_num_seq = range_.file_nums
-            if FileNumSequence.has_subsamples(file_num_seq):
-                if Decimal(group) not in file_num_seq:
-                    return False
-            else:
-                if int(group) not in file_num_seq:
-                    return False
+            if file_num_type(group) not in ranges[i].file_nums:
+                return False
 
         return True
 
+    @cache_in("_membership")
+    def _membership_test(
+        self,
+    ) -> tuple[re.Pattern[str], tuple[str, str], tuple[type[int | Decimal], ...]]:
+        # Everything is built before being cached together,
+        # so that an interrupted call can't leave a partial cache behind.
+        pattern = compile_regex(self._parsed)
+        affixes = format_name_affixes(self._parsed)
+        file_num_types = tuple(
+            [
+                Decimal if FileNumSequence.has_subsamples(range_.file_nums) else int
+                for range_ in self._parsed.ranges.ranges
+            ]
+        )
+        return (pattern, affixes, file_num_types)
+
     def __iter__(self) -> Iterator[PurePathT_co]:
         """Iterate over the paths in this sequence."""
-        iterators = (iter(x) for x in self.file_num_seqs)
-        # TODO: Swap this out for manual looping so that we aren't using mega amounts of memory
-        for result in itertools.product(*iterators):
-            # https://github.com/python/typeshed/issues/13490
-            yield self.path_with_file_nums(*result)  # type: ignore[arg-type]
-
+        # product() holds each file number sequence in memory once,
+        # which is much smaller than the paths that it generates.
+        file_nums = itertools.product(*self.file_num_seqs)
+        with_name = self._path.with_name
+        # https://github.com/python/typeshed/issues/13490
+        names = format_file_names(self._parsed, file_nums)  # type: ignore[arg-type]
+        for name in names:
+            yield with_name(name)
+
+    @cache_in("_len")
     def __len__(self) -> int:
         """Return the length of this sequence.
 
@@ -441,12 +527,22 @@ class BasePurePathSequence(Sequence[PurePathT_co], metaclass=abc.ABCMeta):
             0
         """
         result = 1
-
         for x in self._parsed.ranges.ranges:
             result *= len(x.file_nums)
 
         return result
 
+    def __bool__(self) -> bool:
+        """Return whether this sequence contains any paths.
+
+        This stops at the first empty range instead of calculating the full length.
+        """
+        if self._len is not None:
+            return bool(self._len)
+
+        return all(x.file_nums for x in self._parsed.ranges.ranges)
+
+    @cache_in("_has_subsamples")
     def has_subsamples(self) -> bool:
         """Check whether this path sequence contains any decimal file numbers."""
         return any(r.has_subsamples(r) for r in self._parsed.ranges.ranges)
@@ -464,6 +560,8 @@ class BasePathSequence(BasePurePathSequence[PathT_co], metaclass=abc.ABCMeta):
         ParseError: When the given path is not a valid path sequence.
     """
 
+    __slots__ = ()
+
     _pathlib_type: ClassVar[type[pathlib.Path]] = pathlib.Path
 
     @overload
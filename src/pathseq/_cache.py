@@ -0,0 +1,49 @@
+"""Helpers for caching values calculated from immutable objects.
+
+Cached values are stored in attributes that are unset or ``None``
+until the first time that they are needed.
+Hashes of strings and types differ between processes,
+so objects with a cached hash are pickled by their constructor arguments
+and calculate their caches again after being unpickled.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+from typing import TypeVar
+
+_S = TypeVar("_S")
+_T = TypeVar("_T")
+
+
+def cache_in(name: str) -> Callable[[Callable[[_S], _T]], Callable[[_S], _T]]:
+    """Cache the result of a method in the given attribute.
+
+    The attribute can be left unset until the result is cached.
+    It is set with :func:`object.__setattr__`,
+    so this can be used with frozen dataclasses
+    where the attribute is a slot rather than a field.
+    """
+
+    def decorator(calculate: Callable[[_S], _T]) -> Callable[[_S], _T]:
+        @functools.wraps(calculate)
+        def wrapper(self: _S) -> _T:
+            result: _T | None = getattr(self, name, None)
+            if result is None:
+                result = calculate(self)
+                object.__setattr__(self, name, result)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def reduce_uncached(obj: _T, *args: object) -> tuple[type[_T], tuple[object, ...]]:
+    """Get a ``__reduce__`` value that pickles an object by its constructor arguments.
+
+    This leaves out any cached values.
+    """
+    return (type(obj), args)
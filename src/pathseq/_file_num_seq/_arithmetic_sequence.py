@@ -5,6 +5,7 @@ from typing import overload, Protocol, TypeVar
 from typing_extensions import Self  # PY311
 
 from ._decimal_range import DecimalRange
+from .._cache import cache_in, reduce_uncached
 
 
 FileNumT = TypeVar("FileNumT", int, decimal.Decimal)
@@ -17,10 +18,16 @@ class RangeProtocol(Protocol[FileNumT_cov]):
     @property
     def step(self) -> FileNumT_cov: ...
 
+    def __contains__(self, key: object) -> bool: ...
+
     def __iter__(self) -> Iterator[FileNumT_cov]: ...
 
+    def __reversed__(self) -> Iterator[FileNumT_cov]: ...
+
     def __len__(self) -> int: ...
 
+    def __getitem__(self, index: int) -> FileNumT_cov: ...
+
 
 def remove_exponent(d: decimal.Decimal) -> decimal.Decimal:
     """Remove the exponent and trailing zeros from the given decimal."""
@@ -28,6 +35,18 @@ def remove_exponent(d: decimal.Decimal) -> decimal.Decimal:
 
 
 class ArithmeticSequence(Sequence[FileNumT]):
+    __slots__ = (
+        "__weakref__",
+        "_end",
+        "_hash",
+        "_key",
+        "_len",
+        "_range",
+        "_start",
+        "_step",
+        "_str",
+    )
+
     def __init__(
         self, start: FileNumT, end: FileNumT | None = None, step: FileNumT | None = None
     ) -> None:
@@ -40,21 +59,18 @@ class ArithmeticSequence(Sequence[FileNumT]):
             step = -step
 
         stop: FileNumT
-        if start < end:
+        difference = end - start
+        if difference < 0:
+            stop = end
+        else:
+            if not difference:
+                # Normalise to a step of 1
+                step = start.__class__(1)
+
             # Normalise the end value to match the step
-            remainder = divmod(end - start, step)[1]
-            if remainder:
-                stop = end + (step - remainder)
-                end -= remainder
-            else:
-                stop = end + step
-        elif start == end:
+            end -= difference % step
             # We treat the end as inclusive, ranges don't.
             stop = end + step
-            # Normalise to a step of 1
-            step = start.__class__(1)
-        else:
-            stop = end
 
         self._range: RangeProtocol[FileNumT]
         self._end: FileNumT
@@ -62,14 +78,32 @@ class ArithmeticSequence(Sequence[FileNumT]):
             self._range = range(start, stop, step)
             self._end = end
         else:
+            # The stop is only ever compared against,
+            # so it doesn't need normalising like the observable values do.
             self._range = DecimalRange(
-                remove_exponent(start), remove_exponent(stop), remove_exponent(step)
+                remove_exponent(start), stop, remove_exponent(step)
             )
             self._end = remove_exponent(end)
 
+        self._start: FileNumT = self._range.start
+        self._step: FileNumT = self._range.step
+        # The length can be too large to calculate, so only do so when it's needed.
+        self._len: int | None = None
+        self._key: tuple[type[FileNumT], FileNumT, FileNumT, FileNumT] = (
+            start.__class__,
+            self._start,
+            self._end,
+            self._step,
+        )
+        self._hash: int | None = None
+        self._str: str | None = None
+
+    def __reduce__(self) -> tuple[type[Self], tuple[object, ...]]:
+        return reduce_uncached(self, self._start, self._end, self._step)
+
     @property
     def start(self) -> FileNumT:
-        return self._range.start
+        return self._start
 
     @property
     def end(self) -> FileNumT:
@@ -77,42 +111,123 @@ class ArithmeticSequence(Sequence[FileNumT]):
 
     @property
     def step(self) -> FileNumT:
-        return self._range.step
+        return self._step
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, ArithmeticSequence):
             return NotImplemented
 
-        return (
-            isinstance(self.start, other.start.__class__)
-            and self.start == other.start
-            and self.end == other.end
-            and self.step == other.step
-        )
+        # Hashes are only calculated on demand,
+        # but sequences in sets and dicts will have already calculated theirs.
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
 
+        return self._key == other._key
+
+    @cache_in("_hash")
     def __hash__(self) -> int:
-        return hash((type(self), self.start, self.end, self.step))
+        return hash(self._key)
 
     def __contains__(self, item: object) -> bool:
-        return any(item == x for x in self._range)
+        if isinstance(self._range, range):
+            # range only has a constant time membership test for ints.
+            if isinstance(item, decimal.Decimal):
+                if not item.is_finite() or item != item.to_integral_value():
+                    return False
+
+                item = int(item)
+            elif isinstance(item, float):
+                if not item.is_integer():
+                    return False
+
+                item = int(item)
+
+            return item in self._range
+
+        if isinstance(item, (int, float)):
+            # Floats convert exactly, so this matches comparing them for equality.
+            item = decimal.Decimal(item)
+        elif not isinstance(item, decimal.Decimal):
+            # Other types of number can only be compared for equality.
+            return item in self._range
+
+        if not item.is_finite():
+            return False
+
+        # The step is always positive, so the sequence is contained
+        # within [start, end].
+        difference = item - self._start
+        if difference < 0 or difference > self._end - self._start:
+            return False
+
+        # Terms beyond the context precision are rounded when they are calculated,
+        # so check that the nearest term is calculated to the item.
+        index = (difference / self._step).to_integral_value()
+        return self._start + index * self._step == item
 
     def __iter__(self) -> Iterator[FileNumT]:
         return iter(self._range)
 
+    @cache_in("_len")
     def __len__(self) -> int:
         return len(self._range)
 
+    def __reversed__(self) -> Iterator[FileNumT]:
+        return reversed(self._range)
+
+    def count(self, value: object) -> int:
+        return 1 if value in self else 0
+
+    def index(self, value: object, start: int = 0, stop: int | None = None) -> int:
+        # Only measure the length when a bound is relative to the end.
+        if start < 0:
+            start += len(self)
+        if stop is not None and stop < 0:
+            stop += len(self)
+
+        if value in self:
+            index = self._index_of_member(value)
+            if start <= index and (stop is None or index < stop):
+                return index
+
+        raise ValueError(f"{value} is not in {self.__class__.__name__}")
+
+    def _index_of_member(self, value: object) -> int:
+        # Numbers are converted in the same way as for membership tests,
+        # which is exact because the value is known to equal one of the terms.
+        if isinstance(value, (int, float, decimal.Decimal)):
+            if isinstance(self._range, range):
+                return (int(value) - self._range.start) // self._range.step
+
+            offset = decimal.Decimal(value) - self._range.start
+            return int(offset // self._range.step)
+
+        # Other types of number can only be compared for equality.
+        for index, term in enumerate(self._range):
+            if term == value:
+                return index
+
+        raise ValueError(f"{value} is not in {self.__class__.__name__}")
+
+    @cache_in("_str")
     def __str__(self) -> str:
-        if len(self) == 1:
+        if self._start == self._end:
             return str(self.start)
 
-        result = f"{self.start}-{self.end}"
         if self.step != 1:
-            result += f"x{self.step}"
-        elif len(self) == 2:
-            return ",".join(str(x) for x in self)
+            return f"{self.start}-{self.end}x{self.step}"
 
-        return result
+        if self._end - self._start == 1:
+            return f"{self.start},{self.end}"
+
+        return f"{self.start}-{self.end}"
 
     def __repr__(self) -> str:
         if self.step == 1:
@@ -128,27 +243,19 @@ class ArithmeticSequence(Sequence[FileNumT]):
 
     def __getitem__(self, index: int | slice) -> FileNumT | Self:
         if isinstance(index, slice):
-            start_i, stop_i, step = index.indices(len(self))
-            if step > 0:
-                if start_i >= stop_i:
-                    raise IndexError("slice creates an empty arithemtic sequence")
-            else:
-                if start_i <= stop_i:
-                    raise IndexError("slice creates an empty arithemtic sequence")
-
-            start = self[index.start]
-            try:
-                stop = self[index.stop + 1]
-            except IndexError:
-                stop = self.end
-
-            return self.__class__(start, stop, self.step * index.step)
-
-        if index < 0:
-            index += len(self)
-            if index < 0:
-                raise IndexError("index out of range")
-        elif index >= len(self):
-            raise IndexError("index out of range")
-
-        return self._range.start + index * self._range.step
+            indexes = range(*index.indices(len(self)))
+            if not indexes:
+                raise IndexError("slice creates an empty arithemtic sequence")
+
+            # Arithmetic sequences are always ascending,
+            # so they can't represent the reversed order of a negative step.
+            if indexes.step < 0:
+                raise ValueError("Negative slice steps are not supported")
+
+            return self.__class__(
+                self._start + indexes[0] * self._step,
+                self._start + indexes[-1] * self._step,
+                self._step * indexes.step,
+            )
+
+        return self._range[index]
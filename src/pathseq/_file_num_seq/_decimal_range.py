@@ -2,36 +2,29 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 import decimal
-import math
 
-from typing_extensions import Self  # PY311
+from .._cache import cache_in
 
 
-class DecimalRangeIterator:
-    def __init__(
-        self, start: decimal.Decimal, stop: decimal.Decimal, step: decimal.Decimal
-    ) -> None:
-        self._current = start
-        self._stop = stop
-        self._step = step
-
-    def __iter__(self) -> Self:
-        return self
-
-    def __next__(self) -> decimal.Decimal:
-        if self._step > 0:
-            if self._current >= self._stop:
-                raise StopIteration
-        else:
-            if self._current <= self._stop:
-                raise StopIteration
-
-        next_ = self._current
-        self._current += self._step
-        return next_
+def _iter_decimal_range(
+    start: decimal.Decimal, stop: decimal.Decimal, step: decimal.Decimal
+) -> Iterator[decimal.Decimal]:
+    # Each number is the previous one plus the step,
+    # and the direction is fixed for the whole iteration.
+    current = start
+    if step > 0:
+        while current < stop:
+            yield current
+            current += step
+    else:
+        while current > stop:
+            yield current
+            current += step
 
 
 class DecimalRange:
+    __slots__ = ("__weakref__", "_len", "_start", "_step", "_stop")
+
     def __init__(
         self, start: decimal.Decimal, stop: decimal.Decimal, step: decimal.Decimal
     ) -> None:
@@ -49,6 +42,9 @@ class DecimalRange:
                 f"{self.__class__.__name__}() can only accept normal step numbers"
             )
 
+        # The length can be too large to calculate, so only do so when it's needed.
+        self._len: int | None = None
+
     @property
     def start(self) -> decimal.Decimal:
         return self._start
@@ -65,9 +61,15 @@ class DecimalRange:
         return bool(len(self))
 
     def __contains__(self, key: object) -> bool:
-        if type(key) is not decimal.Decimal:
+        if type(key) is int or type(key) is float:
+            # Floats convert exactly, so this matches comparing them for equality.
+            key = decimal.Decimal(key)
+        elif type(key) is not decimal.Decimal:
             return any(key == v for v in self)
 
+        if not key.is_finite():
+            return False
+
         if self._step > 0:
             if not (self._start <= key < self._stop):
                 return False
@@ -78,11 +80,11 @@ class DecimalRange:
         # x_n = a + d(n-1)
         # key = start + step * (n-1)
         # key - start = step * (n-1)
-        # (key - start) / step = (n-1)
-        # (key - start) / step + 1 = n
-        # where n must be an integer
-        n_minus_one = (key - self._start) / self._step
-        return n_minus_one.as_integer_ratio()[1] == 1
+        # where n must be an integer.
+        # Terms beyond the context precision are rounded when they are calculated,
+        # so check that the nearest term is calculated to the key.
+        n_minus_one = ((key - self._start) / self._step).to_integral_value()
+        return self._start + self._step * n_minus_one == key
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, DecimalRange):
@@ -112,34 +114,33 @@ class DecimalRange:
         return hash(to_hash)
 
     def __iter__(self) -> Iterator[decimal.Decimal]:
-        return DecimalRangeIterator(self.start, self.stop, self.step)
+        return _iter_decimal_range(self._start, self._stop, self._step)
 
+    @cache_in("_len")
     def __len__(self) -> int:
         # x_n = a + d(n-1)
         # stop > start + step * (n-1)
         # stop - start > step * (n-1)
         # (stop - start) / step > (n-1)
-        # (stop - start) / step + 1 > n
-
-        if self._step > 0 and self._start < self._stop:
-            n_minus_one = (self._stop - self._start) / self._step
-            num, denom = n_minus_one.as_integer_ratio()
-            # stop is part of the range, but the range is non-inclusive
-            if denom == 1:
-                return num
+        if (self._step > 0 and self._start < self._stop) or (
+            self._step < 0 and self._start > self._stop
+        ):
+            n_minus_one, remainder = divmod(self._stop - self._start, self._step)
+            # When stop is a term, it is excluded because the range is non-inclusive.
+            return int(n_minus_one) + bool(remainder)
 
-            return math.floor(n_minus_one + 1)
-
-        if self._step < 0 and self._start > self._stop:
-            n_minus_one = (self._stop - self._start) / self._step
-            num, denom = n_minus_one.as_integer_ratio()
-            # stop is part of the range, but the range is non-inclusive
-            if denom == 1:
-                return num
+        return 0
 
-            return math.floor(n_minus_one + 1)
+    def __getitem__(self, index: int) -> decimal.Decimal:
+        length = len(self)
+        if index < 0:
+            index += length
+            if index < 0:
+                raise IndexError(f"{self.__class__.__name__} index out of range")
+        elif index >= length:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
 
-        return 0
+        return self._start + index * self._step
 
     def __repr__(self) -> str:
         if self._step == 1:
@@ -153,7 +154,7 @@ class DecimalRange:
 
         new_stop = self._start - self._step
         new_start = new_stop + self._step * len(self)
-        return DecimalRangeIterator(new_start, new_stop, -self._step)
+        return _iter_decimal_range(new_start, new_stop, -self._step)
 
     def count(self, value: decimal.Decimal) -> int:
         return 1 if value in self else 0
@@ -3,33 +3,12 @@ from __future__ import annotations
 from collections.abc import Iterable, Iterator, Sequence
 import decimal
 import itertools
-from typing import Generic, overload, TypeGuard
-
-from typing_extensions import (
-    Self,  # PY311
-)
+from typing import overload, TypeGuard
 
 from ._arithmetic_sequence import ArithmeticSequence, FileNumT
 from ._parse_file_num_seq import parse_file_num_seq
 
 
-class FileNumSequenceIterator(Generic[FileNumT]):
-    def __init__(self, ranges: tuple[ArithmeticSequence[FileNumT], ...]):
-        self._ranges_iter: Iterator[ArithmeticSequence[FileNumT]] = iter(ranges)
-        self._range_iter: Iterator[FileNumT] = iter(())
-
-    def __iter__(self) -> Self:
-        return self
-
-    def __next__(self) -> FileNumT:
-        try:
-            return next(self._range_iter)
-        except StopIteration:
-            range_ = next(self._ranges_iter)
-            self._range_iter = iter(range_)
-            return next(self._range_iter)
-
-
 def _seqs_from_nums(
     numbers: Iterable[FileNumT],
 ) -> Iterable[ArithmeticSequence[FileNumT]]:
@@ -158,10 +137,11 @@ class FileNumSequence(Sequence[FileNumT]):
 
     def __contains__(self, item: object) -> bool:
         """Return True if the given item is a file number in this sequence."""
-        if not self._ranges:
-            return False
+        for rng in self._ranges:
+            if item in rng:
+                return True
 
-        return any(item in rng for rng in self._ranges)
+        return False
 
     def __iter__(self) -> Iterator[FileNumT]:
         """Iterate over the file numbers in this sequence.
@@ -169,7 +149,7 @@ class FileNumSequence(Sequence[FileNumT]):
         Yields:
             Each file number in the sequence.
         """
-        return FileNumSequenceIterator(self._ranges)
+        return itertools.chain.from_iterable(self._ranges)
 
     def __len__(self) -> int:
         """Get the number of file numbers in this sequence."""
@@ -218,7 +198,7 @@ class FileNumSequence(Sequence[FileNumT]):
             raise IndexError(index)
 
     def __str__(self) -> str:
-        return ",".join(str(rng) for rng in self._ranges)
+        return ",".join([str(rng) for rng in self._ranges])
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self})"
@@ -38,18 +38,11 @@ class _RangeReducer(
     def ranges(
         self, range_: _SeqArgsT, *ranges: _SeqArgsT
     ) -> list[ArithmeticSequence[int]] | list[ArithmeticSequence[D]]:
-        if any("." in arg for arg in range_) or any(
-            "." in arg for r in ranges for arg in r
-        ):
-            return [
-                ArithmeticSequence(*tuple(D(arg) for arg in range_)),
-                *(ArithmeticSequence(*tuple(D(arg) for arg in r)) for r in ranges),
-            ]
-
-        return [
-            ArithmeticSequence(*tuple(int(arg) for arg in range_)),
-            *(ArithmeticSequence(*tuple(int(arg) for arg in r)) for r in ranges),
-        ]
+        all_ranges = (range_, *ranges)
+        if any("." in arg for r in all_ranges for arg in r):
+            return [ArithmeticSequence(*map(D, r)) for r in all_ranges]
+
+        return [ArithmeticSequence(*map(int, r)) for r in all_ranges]
 
     def range(self, start: str, end: str | None, step: str | None) -> _SeqArgsT:
         assert step is None or end is not None, "Parsed an end but no step"
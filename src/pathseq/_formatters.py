@@ -1,42 +1,108 @@
+from collections.abc import Iterable, Iterator, Sequence
 from decimal import Decimal
+import functools
 import re
 
-from ._ast import Formatter, PaddedRange
+from ._ast import (
+    Formatter,
+    PaddedRange,
+    ParsedLooseSequence,
+    ParsedSequence,
+    Ranges,
+)
+from ._ast._formatter import _field_names
 
 
 class GlobFormatter(Formatter):
     """Format to a glob pattern to match paths in the given sequence."""
 
-    def __init__(self) -> None:
-        self._ignore_next_range = False
-
     def range(self, range_: PaddedRange[int] | PaddedRange[Decimal]) -> str:
-        if self._ignore_next_range:
-            self._ignore_next_range = False
-            return ""
-
         return "*"
 
-    def inter_range(self, inter_range: str) -> str:
-        if not inter_range:
-            self._ignore_next_range = True
+    def ranges(self, ranges: Ranges) -> str:
+        # Ranges without a separator between them are matched by a single wildcard,
+        # otherwise they would form a recursive "**" wildcard.
+        parts = [self.range(ranges.ranges[0])]
+        for range_, inter_range in zip(ranges.ranges[1:], ranges.inter_ranges):
+            if inter_range:
+                parts.append(self.inter_range(inter_range))
+                parts.append(self.range(range_))
 
-        return inter_range
+        return "".join(parts)
 
 
-class FileNumberFormatter(Formatter):
-    def __init__(self, *numbers: int | Decimal) -> None:
-        self._numbers = iter(numbers)
+@functools.lru_cache
+def format_name_affixes(seq: ParsedSequence | ParsedLooseSequence) -> tuple[str, str]:
+    """Format the parts of the file name before and after the ranges."""
+    formatter = Formatter()
+    head: list[str] = []
+    tail: list[str] = []
+    parts = head
+    for name in _field_names(type(seq)):
+        if name == "ranges":
+            parts = tail
+            continue
+
+        parts.append(getattr(formatter, name)(getattr(seq, name)))
+
+    return ("".join(head), "".join(tail))
+
+
+def format_file_names(
+    seq: ParsedSequence | ParsedLooseSequence,
+    file_nums: Iterable[Sequence[int | Decimal]],
+) -> Iterator[str]:
+    """Format the file name of each of the given combinations of file numbers.
+
+    The parts of the name around the ranges are only formatted once
+    for each sequence.
+    """
+    head, tail = format_name_affixes(seq)
+    formats = [range_.format for range_ in seq.ranges.ranges]
+
+    if len(formats) == 1:
+        format_ = formats[0]
+        for (number,) in file_nums:
+            yield f"{head}{format_(number)}{tail}"
+
+        return
+
+    formatter = Formatter()
+    inter_ranges = list(seq.ranges.inter_ranges)
+    for numbers in file_nums:
+        spliced = formatter.splice_inter_ranges(
+            [format_(number) for format_, number in zip(formats, numbers)],
+            inter_ranges,
+        )
+        yield f"{head}{spliced}{tail}"
 
-    def range(self, range_: PaddedRange[int] | PaddedRange[Decimal]) -> str:
-        try:
-            number = next(self._numbers)
-        except StopIteration:
-            raise TypeError(
-                "Insufficient number of file numbers given to format sequence"
-            )
 
-        return range_.format(number)
+@functools.lru_cache
+def _range_regex(pad_format: str, has_subsamples: bool) -> str:
+    """Get the regex that matches numbers formatted with the given padding.
+
+    Sequences tend to reuse a handful of padding formats,
+    so the patterns are cached rather than built for every range.
+    """
+    if pad_format == "<UVTILE>":
+        return r"u\d+_v\d+"
+
+    if pad_format == "<UDIM>":
+        pad_format = "####"
+
+    if "." in pad_format:
+        head, tail = pad_format.split(".", 1)
+        tail_re = r"\.[0-9]*" + r"[0-9]" * len(tail)
+    else:
+        head = pad_format
+        tail_re = ""
+        if has_subsamples:
+            tail_re = r"(\.[0-9]+)?"
+
+    positive_re = r"([1-9][0-9]*)?" + r"[0-9]" * len(head)
+    negative_re = r"-([1-9][0-9]*)?" + r"[0-9]" * (len(head) - 1)
+
+    return f"({positive_re}|{negative_re}){tail_re}"
 
 
 class RegexFormatter(Formatter):
@@ -51,35 +117,23 @@ class RegexFormatter(Formatter):
     def prefix(self, prefix: str) -> str:
         return re.escape(super().prefix(prefix))
 
-    def _range(self, range_: PaddedRange[int] | PaddedRange[Decimal]) -> str:
-        if range_.pad_format == "<UVTILE>":
-            return r"u\d+_v\d+"
-
-        pad_format = range_.pad_format
-        if range_.pad_format == "<UDIM>":
-            pad_format = "####"
-
-        if "." in pad_format:
-            head, tail = pad_format.split(".", 1)
-            tail_re = r"\.[0-9]*" + r"[0-9]" * len(tail)
-        else:
-            head = pad_format
-            tail_re = ""
-            if range_.has_subsamples(range_):
-                tail_re = r"(\.[0-9]+)?"
-
-        positive_re = r"([1-9][0-9]*)?" + r"[0-9]" * len(head)
-        negative_re = r"-([1-9][0-9]*)?" + r"[0-9]" * (len(head) - 1)
-
-        return f"({positive_re}|{negative_re}){tail_re}"
-
     def range(self, range_: PaddedRange[int] | PaddedRange[Decimal]) -> str:
-        result = f"(?P<range{self._i}>{self._range(range_)})"
+        pattern = _range_regex(range_.pad_format, range_.has_subsamples(range_))
+        result = f"(?P<range{self._i}>{pattern})"
         self._i += 1
         return result
 
     def inter_range(self, inter_range: str) -> str:
         return re.escape(super().inter_range(inter_range))
 
+    def postfix(self, postfix: str) -> str:
+        return re.escape(super().postfix(postfix))
+
     def suffixes(self, suffixes: tuple[str, ...]) -> str:
         return re.escape(super().suffixes(suffixes))
+
+
+@functools.lru_cache
+def compile_regex(seq: ParsedSequence | ParsedLooseSequence) -> re.Pattern[str]:
+    """Compile a regex pattern that matches the paths in the given sequence."""
+    return re.compile(RegexFormatter().format(seq))
@@ -3,7 +3,6 @@ from decimal import Decimal
 import functools
 import operator
 import pathlib
-import re
 
 from ._ast import (
     RangesStartName,
@@ -13,7 +12,7 @@ from ._ast import (
 )
 from ._error import IncompleteDimensionError
 from ._file_num_seq import FileNumSequence
-from ._formatters import GlobFormatter, RegexFormatter
+from ._formatters import compile_regex, GlobFormatter
 
 
 def find_on_disk(
@@ -33,22 +32,15 @@ def find_on_disk(
     file_str_sets: list[set[str]] = [set() for _ in range(num_ranges)]
     glob_pattern = GlobFormatter().format(parsed)
     paths = path.parent.glob(glob_pattern)
-    pattern = re.compile(RegexFormatter().format(parsed))
+    pattern = compile_regex(parsed)
+    group_names = [f"range{i}" for i in range(num_ranges)]
     num_paths = 0
     for found in paths:
         match = pattern.fullmatch(str(found.name))
         if not match:
             continue
 
-        file_nums = []
-        for i in range(num_ranges):
-            group_name = f"range{i}"
-            group = match.group(group_name)
-            file_nums.append(group)
-
-        if len(file_nums) != num_ranges:
-            continue
-
+        file_nums = [match.group(group_name) for group_name in group_names]
         num_paths += 1
         for file_num, file_str_set in zip(file_nums, file_str_sets):
             file_str_set.add(file_num)
@@ -12,3 +12,5 @@ class LoosePathSequence(LoosePurePathSequence[PathT_co], BasePathSequence[PathT_
             but a regular path.
         ParseError: When the given path is not a valid path sequence.
     """
+
+    __slots__ = ()
@@ -22,6 +22,8 @@ class LoosePurePathSequence(BasePurePathSequence[PurePathT_co]):
         ParseError: When the given path is not a valid path sequence.
     """
 
+    __slots__ = ()
+
     _parsed: ParsedLooseSequence
 
     def _parse(self, name: str) -> ParsedLooseSequence:
@@ -113,8 +115,10 @@ class LoosePurePathSequence(BasePurePathSequence[PurePathT_co]):
             )
 
         new_ranges = tuple(
-            PaddedRange(seq, range_.pad_format)
-            for seq, range_ in zip(seqs, self._parsed.ranges.ranges)
+            [
+                PaddedRange(seq, range_.pad_format)
+                for seq, range_ in zip(seqs, self._parsed.ranges.ranges)
+            ]
         )
         new = self._parsed.__class__(
             stem=self._parsed.stem,
@@ -12,3 +12,5 @@ class PathSequence(PurePathSequence[PathT_co], BasePathSequence[PathT_co]):
             but a regular path.
         ParseError: When the given path is not a valid path sequence.
     """
+
+    __slots__ = ()
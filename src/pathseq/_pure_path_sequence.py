@@ -21,6 +21,8 @@ class PurePathSequence(BasePurePathSequence[PathT_co]):
         ParseError: When the given path is not a valid path sequence.
     """
 
+    __slots__ = ()
+
     _parsed: ParsedSequence
 
     def _parse(self, name: str) -> ParsedSequence:
@@ -46,8 +48,10 @@ class PurePathSequence(BasePurePathSequence[PathT_co]):
             )
 
         new_ranges = tuple(
-            PaddedRange(seq, range_.pad_format)
-            for seq, range_ in zip(seqs, self._parsed.ranges.ranges)
+            [
+                PaddedRange(seq, range_.pad_format)
+                for seq, range_ in zip(seqs, self._parsed.ranges.ranges)
+            ]
         )
         new = self._parsed.__class__(
             self._parsed.stem,
@@ -0,0 +1,181 @@
+from decimal import Decimal
+from fractions import Fraction
+import pickle
+import weakref
+
+import pytest
+
+from pathseq._file_num_seq._arithmetic_sequence import ArithmeticSequence
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        ((5,), [5]),
+        ((5, 5, 3), [5]),
+        ((5, 5, -3), [5]),
+        ((1, 10, 3), [1, 4, 7, 10]),
+        ((1, 11, 3), [1, 4, 7, 10]),
+        ((10, 1), []),
+        ((Decimal("1.5"), Decimal("1.5"), Decimal("0.2")), [Decimal("1.5")]),
+        (
+            (Decimal("1"), Decimal("2.1"), Decimal("0.5")),
+            [Decimal("1"), Decimal("1.5"), Decimal("2")],
+        ),
+    ],
+)
+def test_values(args, expected):
+    seq = ArithmeticSequence(*args)
+    assert list(seq) == expected
+    assert len(seq) == len(expected)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (1, 10),
+        (1, 10, 3),
+        (10, 1, -2),
+        (Decimal("1"), Decimal("2"), Decimal("0.25")),
+    ],
+)
+def test_reversed(args):
+    seq = ArithmeticSequence(*args)
+    assert list(reversed(seq)) == list(seq)[::-1]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (1, 10),
+        (1, 10, 3),
+        (Decimal("1"), Decimal("2"), Decimal("0.25")),
+    ],
+)
+def test_index_and_count(args):
+    seq = ArithmeticSequence(*args)
+    for i, value in enumerate(seq):
+        assert seq.index(value) == i
+        assert seq.count(value) == 1
+
+
+@pytest.mark.parametrize(
+    "args,value,expected",
+    [
+        ((Decimal("1.0"), Decimal("2.0"), Decimal("0.5")), 1.5, 1),
+        ((Decimal("1.0"), Decimal("2.0"), Decimal("0.5")), Fraction(3, 2), 1),
+        ((Decimal("1.0"), Decimal("2.0"), Decimal("0.5")), 2, 2),
+        ((1, 10, 3), 7.0, 2),
+        ((1, 10, 3), Fraction(7), 2),
+        ((1, 10, 3), Decimal("4"), 1),
+    ],
+)
+def test_index_other_types(args, value, expected):
+    seq = ArithmeticSequence(*args)
+    assert seq.index(value) == expected
+    assert seq.index(value) == list(seq).index(value)
+
+
+@pytest.mark.parametrize(
+    "args,value,start,stop",
+    [
+        ((1, 10), 11, 0, None),
+        ((1, 10, 3), 5, 0, None),
+        ((1, 10), 2, 2, None),
+        ((1, 10), 9, 0, -2),
+        ((Decimal("1"), Decimal("2"), Decimal("0.25")), Decimal("1.1"), 0, None),
+    ],
+)
+def test_index_missing(args, value, start, stop):
+    seq = ArithmeticSequence(*args)
+    with pytest.raises(ValueError):
+        seq.index(value, start, stop)
+    assert seq.count(value) == (1 if value in seq else 0)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (1, 10),
+        (1, 10, 3),
+        (Decimal("0"), Decimal("2"), Decimal("0.1")),
+        (Decimal("1"), Decimal("2"), Decimal("0.5")),
+    ],
+)
+@pytest.mark.parametrize(
+    "value",
+    [1.0, 1.5, 4.0, 0.1, float("nan"), float("inf"), Fraction(3, 2), "1"],
+)
+def test_contains_other_types(args, value):
+    seq = ArithmeticSequence(*args)
+    assert (value in seq) is any(value == x for x in seq)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (1, 10),
+        (1, 10, 3),
+        (Decimal("1"), Decimal("2"), Decimal("0.25")),
+    ],
+)
+@pytest.mark.parametrize(
+    "index",
+    [
+        slice(None),
+        slice(1, None),
+        slice(None, -1),
+        slice(1, 3),
+        slice(None, None, 2),
+        slice(-3, None, 2),
+    ],
+)
+def test_getitem_slice(args, index):
+    seq = ArithmeticSequence(*args)
+    assert list(seq[index]) == list(seq)[index]
+
+
+@pytest.mark.parametrize("index", [slice(None, None, -1), slice(-1, 0, -2)])
+def test_getitem_negative_step_slice(index):
+    seq = ArithmeticSequence(1, 5)
+    with pytest.raises(ValueError):
+        seq[index]
+
+
+@pytest.mark.parametrize("index", [slice(3, 1), slice(1, 3, -1), slice(10, None)])
+def test_getitem_empty_slice(index):
+    seq = ArithmeticSequence(1, 5)
+    with pytest.raises(IndexError):
+        seq[index]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        (1, 10),
+        (1, 10, 3),
+        (Decimal("1"), Decimal("2"), Decimal("0.25")),
+    ],
+)
+def test_pickle(args):
+    seq = ArithmeticSequence(*args)
+    hash(seq)
+    unpickled = pickle.loads(pickle.dumps(seq))
+    assert unpickled == seq
+    assert hash(unpickled) == hash(seq)
+    assert list(unpickled) == list(seq)
+
+
+def test_too_long_to_measure():
+    seq = ArithmeticSequence(0, 10**20)
+    assert str(seq) == f"0-{10**20}"
+    assert 10**19 in seq
+    assert seq[5] == 5
+    assert seq.index(7) == 7
+    assert seq == ArithmeticSequence(0, 10**20)
+    assert hash(seq) == hash(ArithmeticSequence(0, 10**20))
+
+
+def test_weakref():
+    seq = ArithmeticSequence(1, 10)
+    assert weakref.ref(seq)() is seq
@@ -1,4 +1,5 @@
 import decimal
+import weakref
 
 from hypothesis import assume, given
 import hypothesis.strategies as st
@@ -160,3 +161,70 @@ def test_count():
 
 def test_index():
     pass
+
+
+@pytest.mark.parametrize(
+    "values,key,expected",
+    [
+        (("1", "3", "0.5"), 2, True),
+        (("1", "3", "0.5"), 3, False),
+        (("1", "3", "0.25"), 1, True),
+        (("1.5", "3", "0.5"), 1, False),
+        (("-1", "-5", "-1"), -3, True),
+        (("0.5", "10", "1"), 3, False),
+    ],
+)
+def test_contains_int(values, key, expected):
+    range_ = DecimalRange(*(decimal.Decimal(value) for value in values))
+    assert (key in range_) is expected
+
+
+@pytest.mark.parametrize(
+    "values,key,expected",
+    [
+        (("1", "3", "0.5"), 1.5, True),
+        (("1", "3", "0.5"), 3.0, False),
+        (("0", "1", "0.1"), 0.1, False),
+        (("1", "3", "0.5"), float("nan"), False),
+        (("1", "3", "0.5"), float("inf"), False),
+    ],
+)
+def test_contains_float(values, key, expected):
+    range_ = DecimalRange(*(decimal.Decimal(value) for value in values))
+    assert (key in range_) is expected
+    assert (key in range_) is any(key == value for value in range_)
+
+
+def test_contains_does_not_round():
+    range_ = DecimalRange(
+        decimal.Decimal(0),
+        decimal.Decimal("100000000000000000000000000000"),
+        decimal.Decimal(3),
+    )
+    assert decimal.Decimal("10000000000000000000000000001") not in range_
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ("1", "3", "0.5"),
+        ("1", "3.1", "0.5"),
+        ("-1", "-5", "-1.5"),
+    ],
+)
+def test_getitem(values):
+    range_ = DecimalRange(*(decimal.Decimal(value) for value in values))
+    expected = list(range_)
+    assert [range_[i] for i in range(len(range_))] == expected
+    assert [range_[-i] for i in range(1, len(range_) + 1)] == expected[::-1]
+
+    with pytest.raises(IndexError):
+        range_[len(range_)]
+
+    with pytest.raises(IndexError):
+        range_[-len(range_) - 1]
+
+
+def test_weakref():
+    range_ = DecimalRange(decimal.Decimal(1), decimal.Decimal(3), decimal.Decimal(1))
+    assert weakref.ref(range_)() is range_
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from itertools import chain
 
 import pytest
@@ -65,3 +66,61 @@ class TestFromFileNums:
         nums_a = FileNumSequence.from_str(str_a)
         nums_b = FileNumSequence.from_str(str_b)
         assert nums_a == nums_b
+
+
+class TestContains:
+    @pytest.mark.parametrize(
+        "seq_str,item",
+        [
+            ("1-10", 1),
+            ("1-10", 10),
+            ("1-10x3", 7),
+            ("1-10,20-30", 25),
+            ("1-10", Decimal("10.0")),
+            ("1-2x0.25", Decimal("1.75")),
+            ("1-2x0.25", Decimal("1.500")),
+            ("1-2x0.25", 2),
+            ("-1.5--0.5x0.5", Decimal("-1")),
+        ],
+    )
+    def test_truthy(self, seq_str, item):
+        assert item in FileNumSequence.from_str(seq_str)
+
+    @pytest.mark.parametrize(
+        "seq_str,item",
+        [
+            ("1-10", 0),
+            ("1-10", 11),
+            ("1-10x3", 8),
+            ("1-10,20-30", 15),
+            ("1-10", Decimal("2.5")),
+            ("1-10", Decimal("Infinity")),
+            ("1-2x0.25", Decimal("1.1")),
+            ("1-2x0.25", Decimal("2.25")),
+            ("1-2x0.25", Decimal("NaN")),
+            ("1-2x0.25", "1.25"),
+        ],
+    )
+    def test_falsey(self, seq_str, item):
+        assert item not in FileNumSequence.from_str(seq_str)
+
+
+class TestGetItem:
+    @pytest.mark.parametrize(
+        "seq_str,index,expected",
+        [
+            ("1-10", 0, 1),
+            ("1-10", 9, 10),
+            ("1-10x3", 2, 7),
+            ("1-10,20-30", 12, 22),
+            ("1-2x0.25", 3, Decimal("1.75")),
+        ],
+    )
+    def test_index(self, seq_str, index, expected):
+        assert FileNumSequence.from_str(seq_str)[index] == expected
+
+    @pytest.mark.parametrize("seq_str", ["1-10", "1-2x0.1"])
+    def test_out_of_range(self, seq_str):
+        file_num_seq = FileNumSequence.from_str(seq_str)
+        with pytest.raises(IndexError):
+            file_num_seq[len(file_num_seq)]
@@ -1,3 +1,7 @@
+import dataclasses
+import pickle
+import weakref
+
 import pytest
 
 from pathseq._parse_loose_path_sequence import (
@@ -606,3 +610,50 @@ class TestPathSequence:
     def test_not_a_sequence(self, seq):
         with pytest.raises(NotASequenceError):
             parse_path_sequence(seq)
+
+
+@pytest.mark.parametrize(
+    "seq",
+    ["1-3#_name.exr", "name_1-3#_v1.exr", "name_1-3#"],
+)
+def test_hash_and_pickle(seq):
+    parsed = parse_path_sequence(seq)
+    assert hash(parsed) == hash(parse_path_sequence(seq))
+    assert hash(parsed) != hash(parsed.with_stem("other"))
+
+    unpickled = pickle.loads(pickle.dumps(parsed))
+    assert unpickled == parsed
+    assert hash(unpickled) == hash(parsed)
+
+
+@pytest.mark.parametrize(
+    "seq",
+    ["1-3#_name.exr", "name_1-3#_v1.exr", "name_1-3#"],
+)
+def test_fields_and_weakref(seq):
+    parsed = parse_path_sequence(seq)
+    str(parsed)
+    hash(parsed)
+    assert "_hash" not in dataclasses.asdict(parsed)
+    assert "_str" not in dataclasses.asdict(parsed)
+    assert weakref.ref(parsed)() is parsed
+
+
+@pytest.mark.parametrize(
+    "seq",
+    ["1-3#_name.exr", "name_1-3#_v1.exr", "name_1-3#.exr", "name_1-3#"],
+)
+def test_unchanged_with_stem_and_suffix(seq):
+    parsed = parse_path_sequence(seq)
+    assert parsed.with_stem(parsed.stem) is parsed
+    if parsed.suffixes:
+        assert parsed.with_suffix(parsed.suffixes[-1]) is parsed
+    else:
+        assert parsed.with_suffix("") is parsed
+
+
+@pytest.mark.parametrize("suffix", ["exr", "."])
+def test_starts_with_invalid_suffix(suffix):
+    parsed = parse_path_sequence("1-3#_name.exr")
+    with pytest.raises(ValueError):
+        parsed.with_suffix(suffix)
@@ -362,3 +362,30 @@ class TestIter:
     def test_simple(self, seq_str, expected):
         seq = LoosePurePathSequence(seq_str)
         assert list(str(x) for x in seq) == expected
+
+
+class TestContains:
+    @pytest.mark.parametrize(
+        "seq_str,path_str",
+        [
+            ("image.1-5####.exr", "image.0003.exr"),
+            ("1-5####_image.exr", "0003_image.exr"),
+            ("image_1-5####+v1.exr", "image_0003+v1.exr"),
+            ("image_1-5####(v1).exr", "image_0003(v1).exr"),
+        ],
+    )
+    def test_truthy(self, seq_str, path_str):
+        seq = LoosePurePathSequence(seq_str)
+        assert pathlib.PurePath(path_str) in seq
+
+    @pytest.mark.parametrize(
+        "seq_str,path_str",
+        [
+            ("image.1-5####.exr", "image.0006.exr"),
+            ("image_1-5####+v1.exr", "image_0003v1.exr"),
+            ("image_1-5####.v1.exr", "image_0003xv1.exr"),
+        ],
+    )
+    def test_falsey(self, seq_str, path_str):
+        seq = LoosePurePathSequence(seq_str)
+        assert pathlib.PurePath(path_str) not in seq
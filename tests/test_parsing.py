@@ -1,3 +1,7 @@
+import dataclasses
+import pickle
+import weakref
+
 import pytest
 
 from pathseq._parse_path_sequence import (
@@ -193,3 +197,36 @@ class TestPathSequence:
     def test_not_a_sequence(self, seq):
         with pytest.raises(NotASequenceError):
             parse_path_sequence(seq)
+
+
+def test_fields_and_weakref():
+    parsed = parse_path_sequence("file.1-10#.exr")
+    str(parsed)
+    hash(parsed)
+    assert [field.name for field in dataclasses.fields(parsed)] == [
+        "stem",
+        "prefix",
+        "ranges",
+        "suffixes",
+    ]
+    assert weakref.ref(parsed)() is parsed
+
+    ranges = parsed.ranges
+    str(ranges)
+    assert [field.name for field in dataclasses.fields(ranges)] == [
+        "ranges",
+        "inter_ranges",
+    ]
+
+    range_ = ranges.ranges[0]
+    str(range_)
+    range_.format(1)
+    assert [field.name for field in dataclasses.fields(range_)] == [
+        "file_nums",
+        "pad_format",
+    ]
+
+    for obj in (ranges, range_):
+        assert not hasattr(obj, "__dict__")
+        assert weakref.ref(obj)() is obj
+        assert pickle.loads(pickle.dumps(obj)) == obj
@@ -1,4 +1,7 @@
+from decimal import Decimal
 import pathlib
+import pickle
+import weakref
 
 import pytest
 
@@ -57,6 +60,18 @@ class TestEqAndHash:
         assert seq1 == seq2
         assert len({seq1, seq2}) == 1
 
+    def test_pickle(self):
+        seq = PurePathSequence("/directory/file.1001-1010#.exr")
+        hash(seq)
+        unpickled = pickle.loads(pickle.dumps(seq))
+        assert unpickled == seq
+        assert hash(unpickled) == hash(seq)
+        assert len(unpickled) == len(seq)
+
+    def test_weakref(self):
+        seq = PurePathSequence("/directory/file.1001-1010#.exr")
+        assert weakref.ref(seq)() is seq
+
 
 class TestRTrueDiv:
     @pytest.mark.parametrize(
@@ -346,3 +361,96 @@ class TestIter:
     def test_simple(self, seq_str, expected):
         seq = PurePathSequence(seq_str)
         assert [str(x) for x in seq] == expected
+
+
+class TestBool:
+    @pytest.mark.parametrize(
+        "seq_str,expected",
+        [
+            ("image.1-5####.exr", True),
+            ("image.####.exr", False),
+            ("texture.####_1-3#.tex", False),
+            ("texture.1011-1012####_1-3#.tex", True),
+        ],
+    )
+    def test_simple(self, seq_str, expected):
+        seq = PurePathSequence(seq_str)
+        assert bool(seq) is expected
+        assert bool(seq) is bool(len(seq))
+
+
+class TestGetItem:
+    @pytest.mark.parametrize(
+        "seq_str",
+        [
+            "image.1-5####.exr",
+            "texture.1011-1012####_1-3#.tex",
+            "texture.1011-1013<UDIM>_1-2#_1,5#.tex",
+        ],
+    )
+    def test_matches_iter(self, seq_str):
+        seq = PurePathSequence(seq_str)
+        expected = list(seq)
+        assert [seq[i] for i in range(len(seq))] == expected
+        assert [seq[i] for i in range(-len(seq), 0)] == expected
+
+    @pytest.mark.parametrize("index", [6, -7])
+    def test_out_of_range(self, index):
+        seq = PurePathSequence("texture.1011-1012####_1-3#.tex")
+        with pytest.raises(IndexError):
+            seq[index]
+
+    def test_empty(self):
+        seq = PurePathSequence("image.####.exr")
+        with pytest.raises(IndexError):
+            seq[0]
+
+
+class TestPathWithFileNums:
+    @pytest.mark.parametrize(
+        "seq_str,numbers,expected",
+        [
+            ("image.1-5####.exr", (3,), "image.0003.exr"),
+            ("texture.1011-1012<UDIM>_1-3#.tex", (1012, 2), "texture.1012_2.tex"),
+            ("image.1-5x0.5#.#.exr", (Decimal("1.5"),), "image.1.5.exr"),
+        ],
+    )
+    def test_simple(self, seq_str, numbers, expected):
+        seq = PurePathSequence(seq_str)
+        assert str(seq.path_with_file_nums(*numbers)) == expected
+
+    def test_insufficient_numbers(self):
+        seq = PurePathSequence("texture.1011-1012<UDIM>_1-3#.tex")
+        with pytest.raises(TypeError):
+            seq.path_with_file_nums(1011)
+
+
+class TestContains:
+    @pytest.mark.parametrize(
+        "seq_str,path_str",
+        [
+            ("/directory/image.1-5####.exr", "/directory/image.0003.exr"),
+            ("image.1-5####.exr", "image.0003.exr"),
+            (
+                "/directory/texture.1011-1012<UDIM>_1-3#.tex",
+                "/directory/texture.1012_2.tex",
+            ),
+        ],
+    )
+    def test_truthy(self, seq_str, path_str):
+        seq = PurePathSequence(seq_str)
+        assert pathlib.PurePath(path_str) in seq
+
+    @pytest.mark.parametrize(
+        "seq_str,path_str",
+        [
+            ("/directory/image.1-5####.exr", "/directory/image.0006.exr"),
+            ("/directory/image.1-5####.exr", "/other/image.0003.exr"),
+            ("/directory/image.1-5####.exr", "image.0003.exr"),
+            ("/directory/image.1-5####.exr", "/directory/image.0003.tif"),
+            ("/directory/image.1-5####.exr", "/directory/other.0003.exr"),
+        ],
+    )
+    def test_falsey(self, seq_str, path_str):
+        seq = PurePathSequence(seq_str)
+        assert pathlib.PurePath(path_str) not in seq